@@ -47,7 +47,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: SpinTouchConfigEntry) ->
 
     coordinator = SpinTouchCoordinator(hass, address, service_info)
 
-    # Initialize coordinator data so restore can work before device connects
+    # Restore the last known readings once for the whole entry, then publish
+    # the data so entities start from it before the device connects
+    coordinator.async_restore_last_states(entry.entry_id)
     coordinator.async_set_updated_data(coordinator._data)
 
     # Register for Bluetooth callbacks when device is seen
@@ -4,18 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.helpers.device_registry import DeviceInfo
-
-from .const import DOMAIN
-
 if TYPE_CHECKING:
     from . import SpinTouchConfigEntry
     from .coordinator import SpinTouchCoordinator
 
-# Device info constants
-MANUFACTURER = "LaMotte"
-MODEL = "WaterLink Spin Touch"
-
 
 class SpinTouchEntity:
     """Mixin providing common SpinTouch entity setup.
@@ -47,9 +39,5 @@ class SpinTouchEntity:
         """
         self._attr_unique_id = f"{entry.entry_id}_{key}"
         self._attr_name = name
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.address)},
-            name=coordinator.device_name,
-            manufacturer=MANUFACTURER,
-            model=MODEL,
-        )
+        # Shared instance - every entity of a device has identical device info
+        self._attr_device_info = coordinator.device_info
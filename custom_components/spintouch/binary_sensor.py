@@ -12,7 +12,7 @@ from homeassistant.const import EntityCategory
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .base import SpinTouchEntity
-from .coordinator import SpinTouchCoordinator
+from .coordinator import SpinTouchCoordinator, SpinTouchData
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -60,7 +60,8 @@ class SpinTouchConnectedSensor(
     @property
     def is_on(self) -> bool:
         """Return True if connected."""
-        return self.coordinator.data.connected if self.coordinator.data else False
+        data: SpinTouchData | None = self.coordinator.data
+        return data.connected if data else False
 
 
 class SpinTouchConnectionEnabledSensor(
@@ -86,4 +87,5 @@ class SpinTouchConnectionEnabledSensor(
     @property
     def is_on(self) -> bool:
         """Return True if connection is enabled."""
-        return self.coordinator.data.connection_enabled if self.coordinator.data else True
+        data: SpinTouchData | None = self.coordinator.data
+        return data.connection_enabled if data else True
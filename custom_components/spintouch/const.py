@@ -6,11 +6,16 @@ See RESEARCH.md for full protocol documentation.
 
 from __future__ import annotations
 
+import struct
 from dataclasses import dataclass
 from enum import IntEnum
 
 DOMAIN = "spintouch"
 
+# Device info
+MANUFACTURER = "LaMotte"
+MODEL = "WaterLink Spin Touch"
+
 # Configuration
 CONF_DISK_SERIES = "disk_series"
 
@@ -57,6 +62,7 @@ START_SIGNATURE = bytes([0x01, 0x02, 0x03, 0x05])  # Prime numbers!
 END_SIGNATURE = bytes([0x07, 0x0B, 0x0D, 0x11])  # Also primes: 7, 11, 13, 17
 HEADER_SIZE = 4  # Start signature: [0x01, 0x02, 0x03, 0x05]
 ENTRY_SIZE = 6  # Each entry: [TestType, Decimals, float32_le]
+ENTRY_STRUCT = struct.Struct("<BBf")  # Precompiled entry layout (ENTRY_SIZE bytes)
 MAX_ENTRIES = 12  # TestResults array has 12 slots
 TIMESTAMP_OFFSET = 76  # Bytes 76-83: YY-MM-DD-HH-MM-SS-AMPM-Military
 TIMESTAMP_SIZE = 8  # Full timestamp including AM/PM and military flags
@@ -5,20 +5,24 @@ from __future__ import annotations
 import asyncio
 import datetime as dt_module
 import logging
-import math
-import struct
-from typing import TYPE_CHECKING
+from functools import cached_property
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from bleak import BleakClient
 from bleak.exc import BleakError
 from bleak_retry_connector import establish_connection
 from homeassistant.components import bluetooth
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.restore_state import async_get as async_get_restore_state
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
     ACK_CHARACTERISTIC_UUID,
+    CALCULATED_SENSORS,
     DATA_CHARACTERISTIC_UUID,
     DISCONNECT_DELAY,
     DISK_TYPE_MAP,
@@ -26,24 +30,28 @@ from .const import (
     END_SIGNATURE,
     END_SIGNATURE_OFFSET,
     ENTRY_SIZE,
+    ENTRY_STRUCT,
     HEADER_SIZE,
+    MANUFACTURER,
     MAX_ENTRIES,
     METADATA_OFFSET,
     MIN_DATA_SIZE,
+    MODEL,
     PARAM_ID_TO_SENSOR,
     RECONNECT_DELAY,
     SANITIZER_TYPE_MAP,
+    SENSORS,
     START_SIGNATURE,
     STATUS_CHARACTERISTIC_UUID,
     TIMESTAMP_OFFSET,
     TIMESTAMP_SIZE,
     VISIBILITY_CHECK_INTERVAL,
-    SensorDefinition,
+    ParamId,
 )
-from .util import TimerManager
+from .util import TimerManager, restore_datetime_state, restore_float_state
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
     from datetime import datetime
 
     from homeassistant.components.bluetooth import BluetoothServiceInfoBleak
@@ -55,13 +63,43 @@ TIMER_DISCONNECT = "disconnect"
 TIMER_RECONNECT = "reconnect"
 TIMER_VISIBILITY_CHECK = "visibility_check"
 
+# Sensor value keys (unique_id suffixes) whose last state is restored on startup
+_RESTORE_VALUE_KEYS: frozenset[str] = frozenset(
+    {sensor.key for sensor in SENSORS} | {sensor.key for sensor in CALCULATED_SENSORS}
+)
+
+# Raw BLE payload - GATT reads return bytearray, parsing never needs a copy
+type BleData = bytes | bytearray | memoryview
+
 
 class SpinTouchData:
     """Container for SpinTouch sensor data."""
 
+    # Read by every entity on each state write; slots keep lookups off a __dict__
+    __slots__ = (
+        "_values",
+        "connected",
+        "connection_enabled",
+        "detected_param_ids",
+        "disk_type",
+        "disk_type_index",
+        "last_reading_time",
+        "num_valid_results",
+        "report_time",
+        "sanitizer_type",
+        "sanitizer_type_index",
+        "values",
+        "values_version",
+    )
+
     def __init__(self) -> None:
         """Initialize data container."""
-        self.values: dict[str, float | None] = {}
+        # Always floats: the parser and restore path coerce before storing.
+        # Consumers get a read-only view; only the parser and restore_value() write.
+        self._values: dict[str, float] = {}
+        self.values: Mapping[str, float] = MappingProxyType(self._values)
+        # Bumped whenever values change, so consumers can skip unchanged updates
+        self.values_version: int = 0
         self.last_reading_time: datetime | None = None
         self.report_time: datetime | None = None
         self.connected: bool = False
@@ -75,6 +113,12 @@ class SpinTouchData:
         self.disk_type: str | None = None
         self.sanitizer_type: str | None = None
 
+    def restore_value(self, key: str, value: float) -> None:
+        """Seed a value restored from state history unless a reading already set it."""
+        if key not in self._values:
+            self._values[key] = value
+            self.values_version += 1
+
     @property
     def detected_disk_series(self) -> str | None:
         """Auto-detect disk series based on which param_ids are present."""
@@ -96,11 +140,16 @@ class SpinTouchData:
 
         return None
 
-    def update_from_bytes(self, data: bytes) -> bool:
+    def update_from_bytes(self, data: BleData) -> bool:
         """Parse BLE data and update values.
 
         Returns True if data was valid AND represents a new report.
+        Data is ignored while connection is disabled (reconnect delay period).
         """
+        if not self.connection_enabled:
+            _LOGGER.debug("Connection disabled, ignoring %d bytes of data", len(data))
+            return False
+
         if len(data) < MIN_DATA_SIZE:
             _LOGGER.warning("Data too short: %d bytes (expected %d)", len(data), MIN_DATA_SIZE)
             return False
@@ -120,15 +169,15 @@ class SpinTouchData:
             return False
 
         entries_parsed = self._parse_entries(data)
+        self.values_version += 1
         _LOGGER.debug("Parsed %d parameter entries", entries_parsed)
 
         self._log_disk_info()
-        self._calculate_derived_values()
 
         self.last_reading_time = dt_util.utcnow()
         return True
 
-    def _validate_signatures(self, data: bytes) -> bool:
+    def _validate_signatures(self, data: BleData) -> bool:
         """Validate start and end signatures."""
         if data[:HEADER_SIZE] != START_SIGNATURE:
             _LOGGER.warning(
@@ -150,26 +199,41 @@ class SpinTouchData:
 
         return True
 
-    def _parse_entries(self, data: bytes) -> int:
-        """Parse parameter entries from BLE data."""
-        offset = HEADER_SIZE
+    def _parse_entries(self, data: BleData) -> int:
+        """Parse parameter entries from BLE data and update derived values."""
         entries_parsed = 0
+        fc: float | None = None
+        tc: float | None = None
+        cya: float | None = None
 
-        while offset + ENTRY_SIZE <= len(data) and entries_parsed < MAX_ENTRIES:
-            test_type = data[offset]
-            decimals = data[offset + 1]
-
+        # MIN_DATA_SIZE guarantees the full entry table is present
+        table = memoryview(data)[HEADER_SIZE : HEADER_SIZE + MAX_ENTRIES * ENTRY_SIZE]
+        for test_type, decimals, raw_value in ENTRY_STRUCT.iter_unpack(table):
             if test_type == 0 and decimals == 0:
                 break
 
-            self._parse_single_entry(data, offset, test_type, decimals)
-            offset += ENTRY_SIZE
+            offset = HEADER_SIZE + entries_parsed * ENTRY_SIZE
+            value = self._parse_single_entry(offset, test_type, decimals, raw_value)
+            # Keep derived-value inputs in locals rather than reading them back
+            if value is not None:
+                if test_type == ParamId.FREE_CHLORINE:
+                    fc = value
+                elif test_type == ParamId.TOTAL_CHLORINE:
+                    tc = value
+                elif test_type == ParamId.CYANURIC_ACID:
+                    cya = value
             entries_parsed += 1
 
+        self._calculate_derived_values(fc, tc, cya)
         return entries_parsed
 
-    def _parse_single_entry(self, data: bytes, offset: int, test_type: int, decimals: int) -> None:
-        """Parse a single test result entry."""
+    def _parse_single_entry(
+        self, offset: int, test_type: int, decimals: int, value: float
+    ) -> float | None:
+        """Store a single unpacked test result entry.
+
+        Returns the stored value, or None if the entry was unknown or invalid.
+        """
         self.detected_param_ids.add(test_type)
 
         sensor = PARAM_ID_TO_SENSOR.get(test_type)
@@ -180,37 +244,29 @@ class SpinTouchData:
                 offset,
                 decimals,
             )
-            return
+            return None
 
-        try:
-            value = struct.unpack_from("<f", data, offset + 2)[0]
-            if self._is_valid_value(value, sensor):
-                display_decimals = decimals if decimals < 10 else sensor.decimals
-                self.values[sensor.key] = round(value, display_decimals)
-                _LOGGER.debug(
-                    "TestType 0x%02X -> %s: %.2f %s",
-                    test_type,
-                    sensor.name,
-                    value,
-                    sensor.unit or "",
-                )
-            else:
-                _LOGGER.debug(
-                    "TestType 0x%02X -> %s: invalid value %s",
-                    test_type,
-                    sensor.name,
-                    value,
-                )
-        except struct.error as err:
-            _LOGGER.error("Failed to parse TestType 0x%02X: %s", test_type, err)
+        # Single range check; NaN fails both comparisons so it is rejected too
+        if not sensor.min_valid <= value <= sensor.max_valid:
+            _LOGGER.debug(
+                "TestType 0x%02X -> %s: invalid value %s",
+                test_type,
+                sensor.name,
+                value,
+            )
+            return None
 
-    def _is_valid_value(self, value: float, sensor: SensorDefinition) -> bool:
-        """Check if a sensor value is valid."""
-        return (
-            value is not None
-            and not math.isnan(value)
-            and sensor.min_valid <= value <= sensor.max_valid
+        display_decimals = decimals if decimals < 10 else sensor.decimals
+        rounded: float = round(value, display_decimals)
+        self._values[sensor.key] = rounded
+        _LOGGER.debug(
+            "TestType 0x%02X -> %s: %.2f %s",
+            test_type,
+            sensor.name,
+            value,
+            sensor.unit or "",
         )
+        return rounded
 
     def _log_disk_info(self) -> None:
         """Log disk type information."""
@@ -224,20 +280,18 @@ class SpinTouchData:
         elif self.detected_disk_series:
             _LOGGER.info("Auto-detected disk series: %s", self.detected_disk_series)
 
-    def _calculate_derived_values(self) -> None:
-        """Calculate derived sensor values."""
-        fc = self.values.get("free_chlorine")
-        tc = self.values.get("total_chlorine")
-        cya = self.values.get("cyanuric_acid")
-
+    def _calculate_derived_values(
+        self, fc: float | None, tc: float | None, cya: float | None
+    ) -> None:
+        """Calculate derived sensor values from this report's FC, TC and CYA."""
         if fc is not None and tc is not None:
             cc = tc - fc
-            self.values["combined_chlorine"] = round(max(0, cc), 2)
+            self._values["combined_chlorine"] = round(max(0.0, cc), 2)
 
         if fc is not None and cya is not None and cya > 0:
-            self.values["fc_cya_ratio"] = round((fc / cya) * 100, 1)
+            self._values["fc_cya_ratio"] = round((fc / cya) * 100, 1)
 
-    def _parse_metadata(self, data: bytes) -> None:
+    def _parse_metadata(self, data: BleData) -> None:
         """Parse metadata from BLE data (bytes 84-86)."""
         if len(data) < METADATA_OFFSET + 3:
             return
@@ -262,21 +316,25 @@ class SpinTouchData:
             self.sanitizer_type,
         )
 
-    def _parse_report_timestamp(self, data: bytes) -> None:
+    def _parse_report_timestamp(self, data: BleData) -> None:
         """Parse the report timestamp from BLE data."""
         if len(data) < TIMESTAMP_OFFSET + TIMESTAMP_SIZE:
             _LOGGER.warning("Data too short for timestamp parsing")
             return
 
         try:
-            year = 2000 + data[TIMESTAMP_OFFSET]
-            month = data[TIMESTAMP_OFFSET + 1]
-            day = data[TIMESTAMP_OFFSET + 2]
-            hour = data[TIMESTAMP_OFFSET + 3]
-            minute = data[TIMESTAMP_OFFSET + 4]
-            second = data[TIMESTAMP_OFFSET + 5]
-            ampm = data[TIMESTAMP_OFFSET + 6]
-            military = data[TIMESTAMP_OFFSET + 7]
+            # Load all 8 timestamp bytes as one little-endian int, then mask fields out
+            word = int.from_bytes(
+                data[TIMESTAMP_OFFSET : TIMESTAMP_OFFSET + TIMESTAMP_SIZE], "little"
+            )
+            year = 2000 + (word & 0xFF)
+            month = (word >> 8) & 0xFF
+            day = (word >> 16) & 0xFF
+            hour = (word >> 24) & 0xFF
+            minute = (word >> 32) & 0xFF
+            second = (word >> 40) & 0xFF
+            ampm = (word >> 48) & 0xFF
+            military = word >> 56
 
             # Convert 12h to 24h if not military time
             if military == 0:
@@ -349,8 +407,12 @@ class SpinTouchCoordinator(DataUpdateCoordinator[SpinTouchData]):  # type: ignor
             _LOGGER,
             name=DOMAIN,
             update_interval=None,
+            # Data is pushed via async_set_updated_data; a refresh (e.g. the
+            # update_entity service) returns the same object and has nothing new
+            always_update=False,
         )
         self.address = address
+        self._default_name = f"SpinTouch {address[-8:].replace(':', '')}"
         self._service_info = service_info
         self._client: BleakClient | None = None
         self._data = SpinTouchData()
@@ -362,14 +424,96 @@ class SpinTouchCoordinator(DataUpdateCoordinator[SpinTouchData]):  # type: ignor
         self._expected_disconnect = False
         self._stay_disconnected = False
         self._reading_received = False
+        self._disconnect_deadline = 0.0
         self._connect_lock = asyncio.Lock()
 
+        # In-flight data read; notifications arriving meanwhile are coalesced
+        self._read_task: asyncio.Task[None] | None = None
+        self._read_pending = False
+
+        # Listeners interested in a single sensor value, indexed by value key
+        self._value_listeners: dict[str, list[CALLBACK_TYPE]] = {}
+        self._published_values: dict[str, float] = {}
+
     @property
     def device_name(self) -> str:
         """Return the device name."""
         if self._service_info and self._service_info.name:
             return str(self._service_info.name)
-        return f"SpinTouch {self.address[-8:].replace(':', '')}"
+        return self._default_name
+
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info shared by all entities of this device."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.address)},
+            name=self.device_name,
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+        )
+
+    @callback  # type: ignore[misc]
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        A string context is treated as a sensor value key: the listener is only
+        called when that value changes, instead of on every coordinator update.
+        """
+        if not isinstance(context, str):
+            return super().async_add_listener(update_callback, context)  # type: ignore[no-any-return]
+
+        listeners = self._value_listeners.setdefault(context, [])
+        listeners.append(update_callback)
+
+        def _remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                del self._value_listeners[context]
+
+        return _remove_listener
+
+    @callback  # type: ignore[misc]
+    def _async_update_value_listeners(self) -> None:
+        """Notify value listeners whose value changed since the last report."""
+        values = self._data.values
+        previous = self._published_values
+        changed = [key for key in self._value_listeners if values.get(key) != previous.get(key)]
+        self._published_values = dict(values)
+
+        for key in changed:
+            for update_callback in list(self._value_listeners.get(key, ())):
+                update_callback()
+
+    @callback  # type: ignore[misc]
+    def async_restore_last_states(self, entry_id: str) -> None:
+        """Seed data with the sensor states saved before the last shutdown.
+
+        Walks the restore state cache once for the whole config entry instead
+        of having every entity await its own lookup when it is added.
+        """
+        last_states = async_get_restore_state(self.hass).last_states
+        prefix = f"{entry_id}_"
+
+        for reg_entry in er.async_entries_for_config_entry(er.async_get(self.hass), entry_id):
+            stored = last_states.get(reg_entry.entity_id)
+            if stored is None or not reg_entry.unique_id.startswith(prefix):
+                continue
+
+            key = reg_entry.unique_id[len(prefix) :]
+            if key in _RESTORE_VALUE_KEYS:
+                value = restore_float_state(stored.state)
+                if value is not None:
+                    self._data.restore_value(key, value)
+            elif key == "last_reading" and not self._data.last_reading_time:
+                self._data.last_reading_time = restore_datetime_state(stored.state)
+            elif key == "report_time" and not self._data.report_time:
+                self._data.report_time = restore_datetime_state(stored.state)
+
+        # Entities start out showing these values, so only later changes need dispatching
+        self._published_values = dict(self._data.values)
+        _LOGGER.debug("Restored %d SpinTouch values from the last run", len(self._data.values))
 
     async def _async_update_data(self) -> SpinTouchData:
         """Fetch data - called by coordinator on demand."""
@@ -472,10 +616,39 @@ class SpinTouchCoordinator(DataUpdateCoordinator[SpinTouchData]):  # type: ignor
             _LOGGER.info("Unexpected disconnect - starting visibility checks")
             self._start_visibility_checks()
 
-    def _on_status_notification(self, _sender: object, _data: bytearray) -> None:
-        """Handle status notification from SpinTouch."""
+    def _on_status_notification(self, _sender: object, data: bytearray) -> None:
+        """Handle status notification from SpinTouch.
+
+        The status characteristic normally sends a one-byte trigger, in which
+        case the results are read from the data characteristic. If the
+        notification already carries a full report, parse it in place and
+        skip the extra GATT round-trip.
+        """
+        if self._stay_disconnected:
+            _LOGGER.debug("Ignoring status notification - in reconnect delay period")
+            return
+
+        if len(data) >= MIN_DATA_SIZE:
+            _LOGGER.debug("Status notification carries %d bytes, parsing directly", len(data))
+            if self._process_reading(data):
+                self.hass.async_create_task(self._async_send_ack())
+            return
+
+        if self._read_task and not self._read_task.done():
+            _LOGGER.debug("Status notification received, read already in progress")
+            self._read_pending = True
+            return
+
         _LOGGER.debug("Status notification received, reading data...")
-        self.hass.async_create_task(self._async_read_data())
+        self._read_task = self.hass.async_create_task(self._async_read_data_coalesced())
+
+    async def _async_read_data_coalesced(self) -> None:
+        """Read data, re-reading once more if notifications arrived meanwhile."""
+        self._read_pending = False
+        await self._async_read_data()
+        while self._read_pending:
+            self._read_pending = False
+            await self._async_read_data()
 
     async def _async_read_data(self) -> None:
         """Read data from the SpinTouch device."""
@@ -483,32 +656,48 @@ class SpinTouchCoordinator(DataUpdateCoordinator[SpinTouchData]):  # type: ignor
             _LOGGER.warning("Cannot read data - not connected")
             return
 
+        if self._stay_disconnected:
+            _LOGGER.debug("Skipping data read - in reconnect delay period")
+            return
+
         try:
             data = await self._client.read_gatt_char(DATA_CHARACTERISTIC_UUID)
             _LOGGER.info("Received %d bytes from SpinTouch", len(data))
 
-            if self._data.update_from_bytes(bytes(data)):
-                _LOGGER.info(
-                    "SpinTouch NEW reading: FC=%.2f pH=%.2f Alk=%.0f Ca=%.0f CYA=%.0f Salt=%.0f",
-                    self._data.values.get("free_chlorine", 0),
-                    self._data.values.get("ph", 0),
-                    self._data.values.get("alkalinity", 0),
-                    self._data.values.get("calcium", 0),
-                    self._data.values.get("cyanuric_acid", 0),
-                    self._data.values.get("salt", 0),
-                )
-
+            if self._process_reading(data):
                 await self._async_send_ack()
 
-                self._reading_received = True
-                self.async_set_updated_data(self._data)
-                self._schedule_disconnect()
-            else:
-                _LOGGER.info("SpinTouch data unchanged (same report timestamp), skipping update")
-
         except BleakError as err:
             _LOGGER.error("Failed to read data: %s", err)
 
+    def _process_reading(self, data: BleData) -> bool:
+        """Parse a test report and publish it if it is new.
+
+        Returns True if a new report was received and should be acknowledged.
+        """
+        if not self._data.update_from_bytes(data):
+            # update_from_bytes logs why (repeated report, bad data or reconnect delay)
+            _LOGGER.info("SpinTouch data not accepted, skipping update")
+            return False
+
+        _LOGGER.info(
+            "SpinTouch NEW reading: FC=%.2f pH=%.2f Alk=%.0f Ca=%.0f CYA=%.0f Salt=%.0f",
+            self._data.values.get("free_chlorine", 0),
+            self._data.values.get("ph", 0),
+            self._data.values.get("alkalinity", 0),
+            self._data.values.get("calcium", 0),
+            self._data.values.get("cyanuric_acid", 0),
+            self._data.values.get("salt", 0),
+        )
+
+        self._reading_received = True
+        # Value sensors are only notified for the keys that changed, but every
+        # accepted report moves last_reading_time, so general listeners always run
+        self.async_set_updated_data(self._data)
+        self._async_update_value_listeners()
+        self._schedule_disconnect()
+        return True
+
     async def _async_send_ack(self) -> None:
         """Send acknowledgment to SpinTouch device."""
         if not self._client or not self._client.is_connected:
@@ -521,21 +710,36 @@ class SpinTouchCoordinator(DataUpdateCoordinator[SpinTouchData]):  # type: ignor
             _LOGGER.warning("Failed to send ACK: %s", err)
 
     def _schedule_disconnect(self) -> None:
-        """Schedule disconnect after delay to allow phone app access."""
+        """Schedule disconnect after delay to allow phone app access.
+
+        Each reading only pushes the deadline forward; an already running
+        timer re-arms itself for the remainder instead of being recreated.
+        """
         self._reading_received = True
+        self._disconnect_deadline = self.hass.loop.time() + DISCONNECT_DELAY
 
-        def _disconnect_callback() -> None:
-            if self._reading_received:
-                _LOGGER.info(
-                    "No new data after %ds, disconnecting to allow phone app access",
-                    DISCONNECT_DELAY,
-                )
-                self._stay_disconnected = True
-                self._data.connection_enabled = False
-                self.async_set_updated_data(self._data)
-                self.hass.async_create_task(self._async_disconnect_and_schedule_reconnect())
+        if not self._timers.is_active(TIMER_DISCONNECT):
+            self._timers.schedule_at(
+                TIMER_DISCONNECT, self._disconnect_deadline, self._on_disconnect_deadline
+            )
+
+    def _on_disconnect_deadline(self) -> None:
+        """Disconnect once DISCONNECT_DELAY has passed since the last reading."""
+        if self.hass.loop.time() < self._disconnect_deadline:
+            self._timers.schedule_at(
+                TIMER_DISCONNECT, self._disconnect_deadline, self._on_disconnect_deadline
+            )
+            return
 
-        self._timers.schedule(TIMER_DISCONNECT, DISCONNECT_DELAY, _disconnect_callback)
+        if self._reading_received:
+            _LOGGER.info(
+                "No new data after %ds, disconnecting to allow phone app access",
+                DISCONNECT_DELAY,
+            )
+            self._stay_disconnected = True
+            self._data.connection_enabled = False
+            self.async_set_updated_data(self._data)
+            self.hass.async_create_task(self._async_disconnect_and_schedule_reconnect())
 
     async def _async_disconnect_and_schedule_reconnect(self) -> None:
         """Disconnect and schedule reconnection after delay."""
@@ -12,7 +12,7 @@ if TYPE_CHECKING:
     from . import SpinTouchConfigEntry
 
 # Keys to redact from diagnostics output
-TO_REDACT = {"address", "unique_id"}
+TO_REDACT: frozenset[str] = frozenset({"address", "unique_id"})
 
 
 async def async_get_config_entry_diagnostics(
@@ -23,10 +23,10 @@ async def async_get_config_entry_diagnostics(
     coordinator = entry.runtime_data
     data = coordinator.data
 
-    # Build sensor values dict, handling None values
-    sensor_values: dict[str, float | None] = {}
-    if data and data.values:
-        sensor_values = dict(data.values)
+    # data.values is a read-only mappingproxy, which HA's JSON encoder cannot
+    # serialise, so it is the one thing copied; the param id set is read as-is
+    sensor_values: dict[str, float] = dict(data.values) if data else {}
+    param_ids: set[int] = data.detected_param_ids if data else set()
 
     # Build diagnostics data
     diagnostics_data: dict[str, Any] = {
@@ -35,7 +35,9 @@ async def async_get_config_entry_diagnostics(
             "version": entry.version,
             "domain": entry.domain,
             "title": entry.title,
-            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            # async_redact_data already returns a fresh dict
+            "data": async_redact_data(entry.data, TO_REDACT),
+            # entry.options is a mappingproxy too, so it still needs the one copy
             "options": dict(entry.options),
         },
         "device": {
@@ -50,11 +52,9 @@ async def async_get_config_entry_diagnostics(
                 data.last_reading_time.isoformat() if data and data.last_reading_time else None
             ),
             "report_time": data.report_time.isoformat() if data and data.report_time else None,
-            "detected_param_ids": (
-                [hex(pid) for pid in sorted(data.detected_param_ids)]
-                if data and data.detected_param_ids
-                else []
-            ),
+            "detected_param_ids": [
+                hex(pid) for pid in (sorted(param_ids) if len(param_ids) > 1 else param_ids)
+            ],
             "num_valid_results": data.num_valid_results if data else 0,
             "disk_type": data.disk_type if data else None,
             "disk_type_index": data.disk_type_index if data else None,
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar
+from dataclasses import dataclass
+from itertools import chain
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -10,6 +12,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.const import EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -19,31 +22,54 @@ from .const import (
     SENSORS,
 )
 from .coordinator import SpinTouchCoordinator, SpinTouchData
-from .util import restore_datetime_state, restore_float_state
-
-# Short display names for water quality status
-PARAMETER_SHORT_NAMES: dict[str, str] = {
-    "free_chlorine": "FC",
-    "total_chlorine": "TC",
-    "bromine": "Br",
-    "ph": "pH",
-    "alkalinity": "Alk",
-    "calcium": "Ca",
-    "cyanuric_acid": "CYA",
-    "copper": "Cu",
-    "iron": "Fe",
-    "phosphate": "Phos",
-    "borate": "Bor",
-    "salt": "Salt",
+
+# Ideal ranges for pool water with short display names (key, short name, min, max)
+_RANGES_SEQ: tuple[tuple[str, str, float, float], ...] = (
+    ("free_chlorine", "FC", 1.0, 3.0),
+    ("ph", "pH", 7.2, 7.6),
+    ("alkalinity", "Alk", 80, 120),
+    ("calcium", "Ca", 200, 400),
+    ("cyanuric_acid", "CYA", 30, 50),
+    ("iron", "Fe", 0, 0.3),
+    ("phosphate", "Phos", 0, 100),
+)
+_RANGE_KEYS: frozenset[str] = frozenset(key for key, _, _, _ in _RANGES_SEQ)
+_TARGET_RANGE_STR: dict[str, str] = {
+    key: f"{min_val}-{max_val}" for key, _, min_val, max_val in _RANGES_SEQ
 }
+# _RANGES_SEQ with the low/high status labels baked in (key, min, max, low, high)
+_RANGE_TABLE: tuple[tuple[str, float, float, str, str], ...] = tuple(
+    (key, min_val, max_val, f"{short} ↓", f"{short} ↑")
+    for key, short, min_val, max_val in _RANGES_SEQ
+)
+
+
+@dataclass(slots=True)
+class Issue:
+    """An out-of-range water quality parameter."""
+
+    value: float
+    status: str
+    label: str
+
+
+class _WaterQualityState(NamedTuple):
+    """Water quality status derived from a single coordinator update."""
+
+    status: str
+    attributes: dict[str, Any]
+    icon: str
+
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from datetime import datetime
 
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from . import SpinTouchConfigEntry
+    from .const import CalculatedSensorDefinition, SensorDefinition
 
 
 async def async_setup_entry(
@@ -54,51 +80,42 @@ async def async_setup_entry(
     """Set up SpinTouch sensors from a config entry."""
     coordinator = entry.runtime_data
 
-    entities: list[SensorEntity] = []
-
-    # Primary sensors from BLE data - create all, users can disable if not needed
-    for sensor_def in SENSORS:
-        entities.append(
-            SpinTouchSensor(
-                coordinator=coordinator,
-                entry=entry,
-                key=sensor_def.key,
-                name=sensor_def.name,
-                unit=sensor_def.unit,
-                icon=sensor_def.icon,
-                decimals=sensor_def.decimals,
-            )
-        )
-
-    # Calculated sensors
-    for calc_sensor in CALCULATED_SENSORS:
-        entities.append(
-            SpinTouchSensor(
-                coordinator=coordinator,
-                entry=entry,
-                key=calc_sensor.key,
-                name=calc_sensor.name,
-                unit=calc_sensor.unit,
-                icon=calc_sensor.icon,
-                decimals=calc_sensor.decimals,
-            )
-        )
-
-    # Diagnostic and status sensors
-    entities.extend(
-        [
-            SpinTouchLastReadingSensor(coordinator=coordinator, entry=entry),
-            SpinTouchReportTimeSensor(coordinator=coordinator, entry=entry),
-            SpinTouchWaterQualitySensor(coordinator=coordinator, entry=entry),
-        ]
+    # Primary sensors from BLE data (create all, users can disable if not
+    # needed) followed by calculated sensors
+    sensor_defs: Iterable[SensorDefinition | CalculatedSensorDefinition] = chain(
+        SENSORS, CALCULATED_SENSORS
     )
-
+    entities: list[SensorEntity] = [
+        *(SpinTouchSensor(coordinator, entry, sensor_def) for sensor_def in sensor_defs),
+        # Diagnostic and status sensors
+        SpinTouchTimestampSensor(
+            coordinator,
+            entry,
+            key="last_reading",
+            name="Last Reading",
+            icon="mdi:clock-outline",
+            field="last_reading_time",
+        ),
+        SpinTouchTimestampSensor(
+            coordinator,
+            entry,
+            key="report_time",
+            name="Report Time",
+            icon="mdi:clipboard-clock-outline",
+            field="report_time",
+        ),
+        SpinTouchWaterQualitySensor(coordinator=coordinator, entry=entry),
+    ]
+
+    # Added in one batch; update_before_add is left at its False default since
+    # data is pushed by the coordinator and there is nothing to poll
     async_add_entities(entities)
 
 
 class SpinTouchSensor(
     SpinTouchEntity,
     CoordinatorEntity[SpinTouchCoordinator],  # type: ignore[misc]
+    # Saves the state on shutdown; the coordinator restores it for all entities
     RestoreEntity,  # type: ignore[misc]
     SensorEntity,  # type: ignore[misc]
 ):
@@ -111,133 +128,102 @@ class SpinTouchSensor(
         self,
         coordinator: SpinTouchCoordinator,
         entry: SpinTouchConfigEntry,
-        key: str,
-        name: str,
-        unit: str | None,
-        icon: str,
-        decimals: int,
+        sensor_def: SensorDefinition | CalculatedSensorDefinition,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._key = key
-        self._decimals = decimals
-
-        self._setup_spintouch_device(coordinator, entry, key, name)
-        self._attr_native_unit_of_measurement = unit
-        self._attr_icon = icon
-        self._attr_suggested_display_precision = decimals
-
-    async def async_added_to_hass(self) -> None:
-        """Restore state on startup."""
-        await super().async_added_to_hass()
-
-        restored_value = await restore_float_state(self)
-        if (
-            restored_value is not None
-            and self.coordinator.data
-            and self._key not in self.coordinator.data.values
-        ):
-            self.coordinator.data.values[self._key] = restored_value
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the sensor value."""
-        if self.coordinator.data:
-            value = self.coordinator.data.values.get(self._key)
-            return float(value) if value is not None else None
-        return None
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.data is not None and self._key in self.coordinator.data.values
-
-
-class SpinTouchLastReadingSensor(
-    SpinTouchEntity,
-    CoordinatorEntity[SpinTouchCoordinator],  # type: ignore[misc]
-    RestoreEntity,  # type: ignore[misc]
-    SensorEntity,  # type: ignore[misc]
-):
-    """Sensor showing the last reading timestamp."""
+        # The value key as listener context: only woken when this value changes
+        super().__init__(coordinator, context=sensor_def.key)
+        self._key = sensor_def.key
+        self._decimals = sensor_def.decimals
 
-    _attr_has_entity_name = True
-    _attr_device_class = SensorDeviceClass.TIMESTAMP
-    _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:clock-outline"
-
-    def __init__(
-        self,
-        coordinator: SpinTouchCoordinator,
-        entry: SpinTouchConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self._setup_spintouch_device(coordinator, entry, "last_reading", "Last Reading")
+        self._setup_spintouch_device(coordinator, entry, sensor_def.key, sensor_def.name)
+        self._attr_native_unit_of_measurement = sensor_def.unit
+        self._attr_icon = sensor_def.icon
+        self._attr_suggested_display_precision = sensor_def.decimals
 
     async def async_added_to_hass(self) -> None:
-        """Restore state on startup."""
+        """Set the initial value from the (possibly restored) data."""
         await super().async_added_to_hass()
+        self._update_from_data()
 
-        restored_dt = await restore_datetime_state(self)
-        if restored_dt and self.coordinator.data and not self.coordinator.data.last_reading_time:
-            self.coordinator.data.last_reading_time = restored_dt
+    @callback  # type: ignore[misc]
+    def _handle_coordinator_update(self) -> None:
+        """Update value and availability before the state is written."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the last reading timestamp."""
+    def _update_from_data(self) -> None:
+        """Store this sensor's value and whether it has been received."""
         data: SpinTouchData | None = self.coordinator.data
-        return data.last_reading_time if data else None
+        value = data.values.get(self._key) if data else None
+        self._attr_native_value = value
+        self._attr_available = value is not None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.data is not None
-            and self.coordinator.data.last_reading_time is not None
-        )
+        return self._attr_available
 
 
-class SpinTouchReportTimeSensor(
+class SpinTouchTimestampSensor(
     SpinTouchEntity,
     CoordinatorEntity[SpinTouchCoordinator],  # type: ignore[misc]
     RestoreEntity,  # type: ignore[misc]
     SensorEntity,  # type: ignore[misc]
 ):
-    """Sensor showing the test report timestamp from SpinTouch device."""
+    """Sensor showing a timestamp tracked in the coordinator data."""
 
     _attr_has_entity_name = True
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_entity_category = EntityCategory.DIAGNOSTIC
-    _attr_icon = "mdi:clipboard-clock-outline"
 
     def __init__(
         self,
         coordinator: SpinTouchCoordinator,
         entry: SpinTouchConfigEntry,
+        *,
+        key: str,
+        name: str,
+        icon: str,
+        field: str,
     ) -> None:
-        """Initialize the sensor."""
+        """Initialize the sensor.
+
+        Args:
+            coordinator: The SpinTouch coordinator instance.
+            entry: The config entry for this device.
+            key: Unique key for this entity (e.g., "last_reading").
+            name: Display name for this entity.
+            icon: Icon for this entity.
+            field: SpinTouchData attribute holding the timestamp.
+        """
         super().__init__(coordinator)
-        self._setup_spintouch_device(coordinator, entry, "report_time", "Report Time")
+        self._field = field
+        self._setup_spintouch_device(coordinator, entry, key, name)
+        self._attr_icon = icon
 
     async def async_added_to_hass(self) -> None:
-        """Restore state on startup."""
+        """Set the initial value from the (possibly restored) timestamp."""
         await super().async_added_to_hass()
+        self._update_from_data()
 
-        restored_dt = await restore_datetime_state(self)
-        if restored_dt and self.coordinator.data and not self.coordinator.data.report_time:
-            self.coordinator.data.report_time = restored_dt
+    @callback  # type: ignore[misc]
+    def _handle_coordinator_update(self) -> None:
+        """Update value and availability before the state is written."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the report timestamp from SpinTouch."""
+    def _update_from_data(self) -> None:
+        """Store the timestamp and whether it is known."""
         data: SpinTouchData | None = self.coordinator.data
-        return data.report_time if data else None
+        value: datetime | None = getattr(data, self._field) if data else None
+        self._attr_native_value = value
+        self._attr_available = value is not None
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and self.coordinator.data.report_time is not None
+        return self._attr_available
 
 
 class SpinTouchWaterQualitySensor(
@@ -250,17 +236,6 @@ class SpinTouchWaterQualitySensor(
     _attr_has_entity_name = True
     _attr_icon = "mdi:water-check"
 
-    # Ideal ranges for pool water (min, max)
-    RANGES: ClassVar[dict[str, tuple[float, float]]] = {
-        "free_chlorine": (1.0, 3.0),
-        "ph": (7.2, 7.6),
-        "alkalinity": (80, 120),
-        "calcium": (200, 400),
-        "cyanuric_acid": (30, 50),
-        "iron": (0, 0.3),
-        "phosphate": (0, 100),
-    }
-
     def __init__(
         self,
         coordinator: SpinTouchCoordinator,
@@ -269,88 +244,99 @@ class SpinTouchWaterQualitySensor(
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._setup_spintouch_device(coordinator, entry, "water_quality", "Water Quality")
-        self._cached_issues: dict[str, dict[str, Any]] | None = None
-        self._last_data_hash: int | None = None
+        # values_version the cached state was computed for (-1: never computed)
+        self._values_version: int | None = -1
+        self._cached_state: _WaterQualityState
+        self._update_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the state from values present when the entity is added."""
+        await super().async_added_to_hass()
+        self._update_state()
+
+    @callback  # type: ignore[misc]
+    def _handle_coordinator_update(self) -> None:
+        """Compute the state once for this update before it is written."""
+        self._update_state()
+        super()._handle_coordinator_update()
 
-    def _get_issues(self) -> dict[str, dict[str, Any]]:
-        """Get all parameters that are out of range with caching."""
-        if not self.coordinator.data or not self.coordinator.data.values:
+    def _update_state(self) -> None:
+        """Recompute the cached state and availability if the values changed."""
+        data: SpinTouchData | None = self.coordinator.data
+        # Connection status updates leave the values untouched
+        version = data.values_version if data is not None else None
+        if version == self._values_version:
+            return
+        self._values_version = version
+        self._attr_available = data is not None and bool(data.values)
+        self._cached_state = self._compute_state()
+
+    def _compute_issues(self) -> dict[str, Issue]:
+        """Get all parameters that are out of range."""
+        data: SpinTouchData | None = self.coordinator.data
+        if not data or not data.values:
             return {}
 
-        # Cache issues to avoid recalculating for icon/attributes
-        current_hash = hash(frozenset(self.coordinator.data.values.items()))
-        if self._cached_issues is not None and self._last_data_hash == current_hash:
-            return self._cached_issues
+        values = data.values
+        issues: dict[str, Issue] = {}
 
-        issues: dict[str, dict[str, Any]] = {}
-        for key, (min_val, max_val) in self.RANGES.items():
-            value = self.coordinator.data.values.get(key)
-            if value is not None:
+        # Only scan when a ranged parameter is present; the scan itself keeps
+        # range table order so the status string is stable between updates
+        if not _RANGE_KEYS.isdisjoint(values):
+            for key, min_val, max_val, low_label, high_label in _RANGE_TABLE:
+                value = values.get(key)
+                if value is None:
+                    continue
                 if value < min_val:
-                    issues[key] = {
-                        "value": value,
-                        "status": "low",
-                        "min": min_val,
-                        "max": max_val,
-                    }
+                    issues[key] = Issue(value, "low", low_label)
                 elif value > max_val:
-                    issues[key] = {
-                        "value": value,
-                        "status": "high",
-                        "min": min_val,
-                        "max": max_val,
-                    }
-
-        self._cached_issues = issues
-        self._last_data_hash = current_hash
+                    issues[key] = Issue(value, "high", high_label)
+
         return issues
 
-    @property
-    def native_value(self) -> str:
-        """Return water quality status."""
-        issues = self._get_issues()
+    def _compute_state(self) -> _WaterQualityState:
+        """Build state, attributes and icon in a single pass."""
+        issues = self._compute_issues()
+        issues_count = len(issues)
+        attributes: dict[str, Any] = {"issues_count": issues_count}
 
         if not issues:
-            return "OK"
+            return _WaterQualityState("OK", attributes, "mdi:water-check")
+
+        # Short names with direction indicator
+        problem_names: list[str] = []
+        formatted: dict[str, dict[str, Any]] = {}
+        for key, info in issues.items():
+            problem_names.append(info.label)
+            formatted[key] = {
+                "value": info.value,
+                "status": info.status,
+                "target_range": _TARGET_RANGE_STR[key],
+            }
+        attributes["issues"] = formatted
 
-        # Build list of short names with direction indicator
-        problem_names = [
-            f"{PARAMETER_SHORT_NAMES.get(key, key)} {'↓' if info['status'] == 'low' else '↑'}"
-            for key, info in issues.items()
-        ]
+        return _WaterQualityState(
+            ", ".join(problem_names),
+            attributes,
+            "mdi:water-alert" if issues_count >= 3 else "mdi:water-remove",
+        )
 
-        return ", ".join(problem_names)
+    @property
+    def native_value(self) -> str:
+        """Return water quality status."""
+        return self._cached_state.status
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return detailed information about water quality."""
-        issues = self._get_issues()
-
-        attributes: dict[str, Any] = {"issues_count": len(issues)}
-
-        if issues:
-            attributes["issues"] = {
-                key: {
-                    "value": info["value"],
-                    "status": info["status"],
-                    "target_range": f"{info['min']}-{info['max']}",
-                }
-                for key, info in issues.items()
-            }
-
-        return attributes
+        return self._cached_state.attributes
 
     @property
     def icon(self) -> str:
         """Return icon based on water quality status."""
-        issues = self._get_issues()
-        if not issues:
-            return "mdi:water-check"
-        if len(issues) >= 3:
-            return "mdi:water-alert"
-        return "mdi:water-remove"
+        return self._cached_state.icon
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.data is not None and bool(self.coordinator.data.values)
+        return self._attr_available
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import math
 from typing import TYPE_CHECKING
 
 from homeassistant.core import HomeAssistant, callback
@@ -13,49 +14,60 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from datetime import datetime
 
-    from homeassistant.helpers.restore_state import RestoreEntity
+    from homeassistant.core import State
 
 _LOGGER = logging.getLogger(__name__)
 
 # States that indicate no valid data to restore
-INVALID_RESTORE_STATES = (None, "unknown", "unavailable")
+INVALID_RESTORE_STATES: frozenset[str | None] = frozenset({None, "unknown", "unavailable"})
 
+# First characters a restorable numeric state can start with
+_NUMBER_START = frozenset("-0123456789")
 
-async def restore_float_state(entity: RestoreEntity) -> float | None:
-    """Restore a float value from entity state history.
+
+def restore_float_state(last_state: State | None) -> float | None:
+    """Restore a float value from a stored entity state.
 
     Args:
-        entity: The RestoreEntity instance to get previous state from.
+        last_state: The entity state saved before the last shutdown, if any.
 
     Returns:
         The restored float value, or None if restoration failed.
     """
-    last_state = await entity.async_get_last_state()
     if last_state is None or last_state.state in INVALID_RESTORE_STATES:
         return None
 
+    # Sensor states are plain decimals; skip float() for anything that is not
+    state = last_state.state
+    if not state or state[0] not in _NUMBER_START:
+        return None
+
     try:
-        return float(last_state.state)
-    except (ValueError, TypeError):
+        value = float(state)
+    except ValueError:
         return None
 
+    # "-inf", "-nan" and overflowing literals like "1e400" pass the check above
+    return value if math.isfinite(value) else None
 
-async def restore_datetime_state(entity: RestoreEntity) -> datetime | None:
-    """Restore a datetime value from entity state history.
+
+def restore_datetime_state(last_state: State | None) -> datetime | None:
+    """Restore a datetime value from a stored entity state.
 
     Args:
-        entity: The RestoreEntity instance to get previous state from.
+        last_state: The entity state saved before the last shutdown, if any.
 
     Returns:
         The restored datetime value (timezone-aware), or None if restoration failed.
     """
-    last_state = await entity.async_get_last_state()
     if last_state is None or last_state.state in INVALID_RESTORE_STATES:
         return None
 
+    # parse_datetime returns None for malformed strings but raises ValueError for
+    # well-formed ones that are not a valid date (e.g. month 13)
     try:
         return dt_util.parse_datetime(last_state.state)  # type: ignore[no-any-return]
-    except (ValueError, TypeError):
+    except ValueError:
         return None
 
 
@@ -76,6 +88,7 @@ class TimerManager:
         self._hass = hass
         self._logger = logger or _LOGGER
         self._timers: dict[str, asyncio.TimerHandle] = {}
+        self._callbacks: dict[str, Callable[[], None]] = {}
 
     def schedule(
         self,
@@ -95,15 +108,37 @@ class TimerManager:
         """
         # Cancel existing timer with same name (restart behavior)
         self.cancel(name)
+        self._callbacks[name] = callback_fn
+        self._timers[name] = self._hass.loop.call_later(delay, self._fire, name)
+        self._logger.debug("Timer '%s' scheduled for %ds", name, delay)
 
-        @callback  # type: ignore[misc]
-        def _timer_callback() -> None:
-            """Execute callback and clean up timer reference."""
-            self._timers.pop(name, None)
-            callback_fn()
+    def schedule_at(
+        self,
+        name: str,
+        when: float,
+        callback_fn: Callable[[], None],
+    ) -> None:
+        """Schedule a callback at an absolute event loop time.
 
-        self._timers[name] = self._hass.loop.call_later(delay, _timer_callback)
-        self._logger.debug("Timer '%s' scheduled for %ds", name, delay)
+        Like schedule(), any existing timer with the same name is canceled first.
+
+        Args:
+            name: Unique identifier for this timer.
+            when: Event loop time (as returned by loop.time()) to fire at.
+            callback_fn: Function to call when the timer fires.
+        """
+        self.cancel(name)
+        self._callbacks[name] = callback_fn
+        self._timers[name] = self._hass.loop.call_at(when, self._fire, name)
+        self._logger.debug("Timer '%s' scheduled at loop time %.1f", name, when)
+
+    @callback  # type: ignore[misc]
+    def _fire(self, name: str) -> None:
+        """Execute a timer's callback and clean up its references."""
+        self._timers.pop(name, None)
+        callback_fn = self._callbacks.pop(name, None)
+        if callback_fn is not None:
+            callback_fn()
 
     def cancel(self, name: str) -> bool:
         """Cancel a scheduled timer.
@@ -115,6 +150,7 @@ class TimerManager:
             True if a timer was canceled, False if no timer was found.
         """
         timer = self._timers.pop(name, None)
+        self._callbacks.pop(name, None)
         if timer:
             timer.cancel()
             self._logger.debug("Timer '%s' canceled", name)
@@ -123,8 +159,14 @@ class TimerManager:
 
     def cancel_all(self) -> None:
         """Cancel all active timers."""
-        for name in list(self._timers.keys()):
-            self.cancel(name)
+        timers = self._timers
+        count = len(timers)
+        for timer in timers.values():
+            timer.cancel()
+        timers.clear()
+        self._callbacks.clear()
+        if count:
+            self._logger.debug("Canceled %d timers", count)
 
     def is_active(self, name: str) -> bool:
         """Check if a timer is currently active.
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import sys
+from types import MappingProxyType, SimpleNamespace
 from typing import TYPE_CHECKING, Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -34,7 +35,8 @@ sys.modules["bleak"] = mock_bleak
 sys.modules["bleak_retry_connector"] = MagicMock()
 
 # Now import spintouch modules (must be after mocking)
-from custom_components.spintouch.const import SERVICE_UUID  # noqa: E402
+from custom_components.spintouch.config_flow import SpinTouchConfigFlow  # noqa: E402
+from custom_components.spintouch.const import CONF_DISK_SERIES, SERVICE_UUID  # noqa: E402
 
 # Enable pytest-asyncio auto mode
 pytest_plugins = "pytest_homeassistant_custom_component"
@@ -66,15 +68,66 @@ def mock_bluetooth_fixture() -> Generator[MagicMock, None, None]:
         yield mock_bt
 
 
+@pytest.fixture(scope="session")
+def _hass_proto() -> Mock:
+    """Build the stand-in HomeAssistant used by the flow tests once per session."""
+    hass = Mock()
+    hass.config_entries.async_entries.return_value = []
+    return hass
+
+
+@pytest.fixture
+def hass_mock(_hass_proto: Mock) -> Mock:
+    """Return the shared stand-in HomeAssistant with its call history cleared.
+
+    A copy.copy() of a Mock shares its child mocks with the original, so
+    copying would not isolate call assertions between tests. Resetting the
+    prototype keeps configured return values while clearing recorded calls.
+    """
+    _hass_proto.reset_mock()
+    return _hass_proto
+
+
 @pytest.fixture
-def mock_bluetooth_service_info() -> MagicMock:
-    """Create a mock BluetoothServiceInfoBleak."""
-    service_info = MagicMock()
-    service_info.address = "BB:BD:05:0B:2D:1F"
-    service_info.name = "SpinTouch-0B2D1F"
-    service_info.service_uuids = [SERVICE_UUID]
-    service_info.rssi = -60
-    return service_info
+def config_flow(monkeypatch: pytest.MonkeyPatch, hass_mock: Mock) -> SpinTouchConfigFlow:
+    """Return a config flow with unique ID handling and entry creation stubbed out.
+
+    The replaced async_create_entry is a Mock returning a create_entry
+    result, so tests can assert on its call arguments directly.
+    """
+    flow = SpinTouchConfigFlow()
+    flow.hass = hass_mock
+    flow.context = {}
+    monkeypatch.setattr(flow, "async_set_unique_id", AsyncMock(return_value=None))
+    monkeypatch.setattr(flow, "_abort_if_unique_id_configured", Mock(return_value=None))
+    monkeypatch.setattr(flow, "async_create_entry", Mock(return_value={"type": "create_entry"}))
+    return flow
+
+
+@pytest.fixture(scope="session")
+def mock_bluetooth_service_info() -> SimpleNamespace:
+    """Create a stand-in BluetoothServiceInfoBleak.
+
+    Tests only read these attributes, so one instance is shared per session.
+    """
+    return SimpleNamespace(
+        address="BB:BD:05:0B:2D:1F",
+        name="SpinTouch-0B2D1F",
+        service_uuids=[SERVICE_UUID],
+        rssi=-60,
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_entry() -> SimpleNamespace:
+    """Create a stand-in SpinTouch config entry shared per session.
+
+    The data is a read-only mapping so no test can change it for the others.
+    """
+    return SimpleNamespace(
+        data=MappingProxyType({"address": "BB:BD:05:0B:2D:1F", CONF_DISK_SERIES: "auto"}),
+        title="SpinTouch-0B2D1F",
+    )
 
 
 @pytest.fixture
@@ -94,116 +147,39 @@ def mock_bleak_client() -> Generator[MagicMock, None, None]:
 
 # Sample BLE data from a real SpinTouch device (Chlorine 303 disk)
 # Start signature + 12 entries + timestamp + metadata + end signature
-SAMPLE_BLE_DATA = bytes(
-    [
-        # Start signature
-        0x01,
-        0x02,
-        0x03,
-        0x05,
-        # Entry 1: Free Chlorine (0x01), 2 decimals, 2.50 ppm
-        0x01,
-        0x02,
-        0x00,
-        0x00,
-        0x20,
-        0x40,
-        # Entry 2: Total Chlorine (0x02), 2 decimals, 2.75 ppm
-        0x02,
-        0x02,
-        0x00,
-        0x00,
-        0x30,
-        0x40,
-        # Entry 3: Combined Chlorine placeholder (0x11), 2 decimals, 0.25 ppm
-        0x11,
-        0x02,
-        0x00,
-        0x00,
-        0x80,
-        0x3E,
-        # Entry 4: pH (0x06), 1 decimal, 7.40
-        0x06,
-        0x01,
-        0xCD,
-        0xCC,
-        0xEC,
-        0x40,
-        # Entry 5: Alkalinity (0x07), 0 decimals, 100 ppm
-        0x07,
-        0x00,
-        0x00,
-        0x00,
-        0xC8,
-        0x42,
-        # Entry 6: Calcium (0x0F), 0 decimals, 250 ppm
-        0x0F,
-        0x00,
-        0x00,
-        0x00,
-        0x7A,
-        0x43,
-        # Entry 7: Cyanuric Acid (0x0A), 0 decimals, 40 ppm
-        0x0A,
-        0x00,
-        0x00,
-        0x00,
-        0x20,
-        0x42,
-        # Entry 8: Copper (0x0C), 2 decimals, 0.10 ppm
-        0x0C,
-        0x02,
-        0xCD,
-        0xCC,
-        0xCC,
-        0x3D,
-        # Entry 9: Iron (0x0B), 2 decimals, 0.05 ppm
-        0x0B,
-        0x02,
-        0xCD,
-        0xCC,
-        0x4C,
-        0x3D,
-        # Entry 10: Borate (0x0D), 1 decimal, 30.0 ppm
-        0x0D,
-        0x01,
-        0x00,
-        0x00,
-        0xF0,
-        0x41,
-        # Entry 11: Salt (0x10), 0 decimals, 3000 ppm
-        0x10,
-        0x00,
-        0x00,
-        0x80,
-        0x3B,
-        0x45,
-        # Entry 12: Empty
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        0x00,
-        # Timestamp: 2025-11-29 12:30:45
-        0x19,
-        0x0B,
-        0x1D,
-        0x0C,
-        0x1E,
-        0x2D,
-        0x00,
-        0x01,
-        # Metadata: 10 valid results, disk type 18 (303), sanitizer 0 (Chlorine)
-        0x0A,
-        0x12,
-        0x00,
-        # End signature
-        0x07,
-        0x0B,
-        0x0D,
-        0x11,
-    ]
+SAMPLE_BLE_DATA = bytes.fromhex(
+    # Start signature
+    "01020305"
+    # Entry 1: Free Chlorine (0x01), 2 decimals, 2.50 ppm
+    "010200002040"
+    # Entry 2: Total Chlorine (0x02), 2 decimals, 2.75 ppm
+    "020200003040"
+    # Entry 3: Combined Chlorine placeholder (0x11), 2 decimals, 0.25 ppm
+    "11020000803E"
+    # Entry 4: pH (0x06), 1 decimal, 7.40
+    "0601CDCCEC40"
+    # Entry 5: Alkalinity (0x07), 0 decimals, 100 ppm
+    "07000000C842"
+    # Entry 6: Calcium (0x0F), 0 decimals, 250 ppm
+    "0F0000007A43"
+    # Entry 7: Cyanuric Acid (0x0A), 0 decimals, 40 ppm
+    "0A0000002042"
+    # Entry 8: Copper (0x0C), 2 decimals, 0.10 ppm
+    "0C02CDCCCC3D"
+    # Entry 9: Iron (0x0B), 2 decimals, 0.05 ppm
+    "0B02CDCC4C3D"
+    # Entry 10: Borate (0x0D), 1 decimal, 30.0 ppm
+    "0D010000F041"
+    # Entry 11: Salt (0x10), 0 decimals, 3000 ppm
+    "100000803B45"
+    # Entry 12: Empty
+    "000000000000"
+    # Timestamp: 2025-11-29 12:30:45
+    "190B1D0C1E2D0001"
+    # Metadata: 10 valid results, disk type 18 (303), sanitizer 0 (Chlorine)
+    "0A1200"
+    # End signature
+    "070B0D11"
 )
 
 
@@ -2,13 +2,67 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import struct
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from homeassistant.core import State
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache,
+)
 
 from custom_components.spintouch.const import (
+    DISCONNECT_DELAY,
+    DOMAIN,
     END_SIGNATURE,
     START_SIGNATURE,
 )
-from custom_components.spintouch.coordinator import SpinTouchData
+from custom_components.spintouch.coordinator import (
+    TIMER_DISCONNECT,
+    SpinTouchCoordinator,
+    SpinTouchData,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable
+
+    from homeassistant.core import HomeAssistant
+
+    type BlePacketFactory = Callable[..., bytes]
+
+TEST_ADDRESS = "AA:BB:CC:DD:EE:FF"
+# One unused test entry: type 0x00, 0 decimals, 0.0 as a little-endian float
+_EMPTY_ENTRY = bytes(6)
+_F32 = struct.Struct("<f")
+_VALID_READING = {
+    "free_chlorine": 2.5,
+    "ph": 7.4,
+    "alkalinity": 100.0,
+    "calcium": 250.0,
+    "cyanuric_acid": 40.0,
+}
+
+
+@pytest.fixture(scope="module")
+def ble_packet_factory() -> BlePacketFactory:
+    """Return a BLE packet builder memoized across this module's tests."""
+    return functools.lru_cache(maxsize=64)(build_test_ble_data)
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant) -> AsyncGenerator[SpinTouchCoordinator]:
+    """Return a coordinator that is not connected to any device."""
+    coordinator = SpinTouchCoordinator(hass, TEST_ADDRESS)
+    yield coordinator
+    coordinator._timers.cancel_all()
 
 
 class TestSpinTouchData:
@@ -28,32 +82,90 @@ class TestSpinTouchData:
         assert data.disk_type is None
         assert data.sanitizer_type is None
 
-    def test_update_from_bytes_valid_data(self) -> None:
-        """Test parsing valid BLE data."""
+    def test_values_read_only(self) -> None:
+        """Test values are exposed as a read-only view."""
         data = SpinTouchData()
 
-        # Build valid test data
-        ble_data = build_test_ble_data(
-            free_chlorine=2.5,
-            ph=7.4,
-            alkalinity=100.0,
-            calcium=250.0,
-            cyanuric_acid=40.0,
-        )
+        with pytest.raises(TypeError):
+            data.values["ph"] = 7.4  # type: ignore[index]
 
-        result = data.update_from_bytes(ble_data)
+    def test_no_instance_dict(self) -> None:
+        """Test the data container uses slots instead of a per-instance dict."""
+        data = SpinTouchData()
+
+        assert not hasattr(data, "__dict__")
+        with pytest.raises(AttributeError):
+            data.unknown = 1  # type: ignore[attr-defined]
+
+    def test_restore_value(self, ble_packet_factory: BlePacketFactory) -> None:
+        """Test restored values only fill keys without a reading."""
+        data = SpinTouchData()
+        data.update_from_bytes(ble_packet_factory(free_chlorine=2.5, ph=7.4))
+
+        data.restore_value("ph", 6.8)
+        data.restore_value("salt", 3200.0)
 
-        assert result is True
-        assert "free_chlorine" in data.values
-        assert abs(data.values["free_chlorine"] - 2.5) < 0.1
-        assert "ph" in data.values
         assert abs(data.values["ph"] - 7.4) < 0.1
-        assert "alkalinity" in data.values
-        assert abs(data.values["alkalinity"] - 100.0) < 1.0
-        assert "calcium" in data.values
-        assert abs(data.values["calcium"] - 250.0) < 1.0
-        assert "cyanuric_acid" in data.values
-        assert abs(data.values["cyanuric_acid"] - 40.0) < 1.0
+        assert data.values["salt"] == 3200.0
+
+    def test_values_version(self, ble_packet_factory: BlePacketFactory) -> None:
+        """Test values_version only changes when values change."""
+        data = SpinTouchData()
+        ble_data = ble_packet_factory(free_chlorine=2.5, ph=7.4)
+
+        data.update_from_bytes(ble_data)
+        version = data.values_version
+        assert version > 0
+
+        # Duplicate report and restoring an already-read key change nothing
+        data.update_from_bytes(ble_data)
+        data.restore_value("ph", 6.8)
+        assert data.values_version == version
+
+        data.restore_value("salt", 3200.0)
+        assert data.values_version == version + 1
+
+    @pytest.mark.parametrize(
+        ("kwargs", "key", "expected", "tol"),
+        [
+            (_VALID_READING, "free_chlorine", 2.5, 0.1),
+            (_VALID_READING, "ph", 7.4, 0.1),
+            (_VALID_READING, "alkalinity", 100.0, 1.0),
+            (_VALID_READING, "calcium", 250.0, 1.0),
+            (_VALID_READING, "cyanuric_acid", 40.0, 1.0),
+            (
+                {"free_chlorine": 2.0, "total_chlorine": 2.5, "ph": 7.4},
+                "combined_chlorine",
+                0.5,
+                0.1,
+            ),
+            # FC/CYA = 4/50 * 100 = 8%
+            ({"free_chlorine": 4.0, "cyanuric_acid": 50.0, "ph": 7.4}, "fc_cya_ratio", 8.0, 0.5),
+        ],
+    )
+    def test_update_from_bytes_values(
+        self,
+        ble_packet_factory: BlePacketFactory,
+        kwargs: dict[str, float],
+        key: str,
+        expected: float,
+        tol: float,
+    ) -> None:
+        """Test parsed and calculated values from valid BLE data."""
+        data = SpinTouchData()
+
+        assert data.update_from_bytes(ble_packet_factory(**kwargs)) is True
+        assert key in data.values
+        assert abs(data.values[key] - expected) < tol
+
+    def test_update_from_bytes_accepts_buffers(self, ble_packet_factory: BlePacketFactory) -> None:
+        """Test parsing accepts bytearray and memoryview without copying."""
+        ble_data = ble_packet_factory(free_chlorine=2.5, ph=7.4)
+
+        for buffer in (bytearray(ble_data), memoryview(ble_data)):
+            data = SpinTouchData()
+            assert data.update_from_bytes(buffer) is True
+            assert abs(data.values["free_chlorine"] - 2.5) < 0.1
 
     def test_update_from_bytes_too_short(self) -> None:
         """Test parsing rejects data that is too short."""
@@ -78,11 +190,25 @@ class TestSpinTouchData:
 
         assert result is False
 
-    def test_update_from_bytes_duplicate_timestamp(self) -> None:
+    def test_update_from_bytes_connection_disabled(
+        self, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test parsing is skipped while connection is disabled."""
+        data = SpinTouchData()
+        data.connection_enabled = False
+
+        result = data.update_from_bytes(ble_packet_factory(free_chlorine=2.5, ph=7.4))
+
+        assert result is False
+        assert data.values == {}
+
+    def test_update_from_bytes_duplicate_timestamp(
+        self, ble_packet_factory: BlePacketFactory
+    ) -> None:
         """Test parsing returns False for unchanged timestamp."""
         data = SpinTouchData()
 
-        ble_data = build_test_ble_data(free_chlorine=2.5, ph=7.4)
+        ble_data = ble_packet_factory(free_chlorine=2.5, ph=7.4)
 
         # First parse should succeed
         result1 = data.update_from_bytes(ble_data)
@@ -92,74 +218,53 @@ class TestSpinTouchData:
         result2 = data.update_from_bytes(ble_data)
         assert result2 is False
 
-    def test_calculated_combined_chlorine(self) -> None:
-        """Test combined chlorine calculation."""
-        data = SpinTouchData()
-
-        ble_data = build_test_ble_data(
-            free_chlorine=2.0,
-            total_chlorine=2.5,
-            ph=7.4,
-        )
-
-        result = data.update_from_bytes(ble_data)
-
-        assert result is True
-        assert "combined_chlorine" in data.values
-        assert abs(data.values["combined_chlorine"] - 0.5) < 0.1
-
-    def test_calculated_fc_cya_ratio(self) -> None:
-        """Test FC/CYA ratio calculation."""
+    def test_last_reading_time_set_on_new_report(
+        self, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test last reading time is available after a new report."""
         data = SpinTouchData()
 
-        ble_data = build_test_ble_data(
-            free_chlorine=4.0,
-            cyanuric_acid=50.0,
-            ph=7.4,
-        )
-
-        result = data.update_from_bytes(ble_data)
+        data.update_from_bytes(ble_packet_factory(free_chlorine=2.5, ph=7.4))
 
-        assert result is True
-        assert "fc_cya_ratio" in data.values
-        # FC/CYA = 4/50 * 100 = 8%
-        assert abs(data.values["fc_cya_ratio"] - 8.0) < 0.5
+        assert data.last_reading_time is not None
+        assert data.last_reading_time.tzinfo is not None
 
-    def test_detected_disk_series_chlorine(self) -> None:
-        """Test disk series detection for chlorine disk."""
+    def test_calculated_combined_chlorine_clamped(
+        self, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test combined chlorine never goes negative and is stored as a float."""
         data = SpinTouchData()
 
-        ble_data = build_test_ble_data(
-            free_chlorine=2.5,
-            total_chlorine=2.5,
-            ph=7.4,
-        )
+        ble_data = ble_packet_factory(free_chlorine=3.0, total_chlorine=2.5)
 
         data.update_from_bytes(ble_data)
 
-        # Should detect as 303 (chlorine disk)
-        assert data.detected_disk_series == "303"
-
-    def test_detected_disk_series_bromine(self) -> None:
-        """Test disk series detection for bromine disk."""
+        assert data.values["combined_chlorine"] == 0.0
+        assert isinstance(data.values["combined_chlorine"], float)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected"),
+        [
+            ({"free_chlorine": 2.5, "total_chlorine": 2.5, "ph": 7.4}, "303"),
+            ({"bromine": 5.0, "ph": 7.4}, "203"),
+        ],
+        ids=["chlorine", "bromine"],
+    )
+    def test_detected_disk_series(
+        self, ble_packet_factory: BlePacketFactory, kwargs: dict[str, float], expected: str
+    ) -> None:
+        """Test disk series detection from the sanitizer entries present."""
         data = SpinTouchData()
 
-        # Build data with bromine instead of chlorine
-        ble_data = build_test_ble_data(
-            bromine=5.0,
-            ph=7.4,
-        )
+        data.update_from_bytes(ble_packet_factory(**kwargs))
 
-        data.update_from_bytes(ble_data)
-
-        # Should detect as 203 (bromine disk)
-        assert data.detected_disk_series == "203"
+        assert data.detected_disk_series == expected
 
-    def test_metadata_parsing(self) -> None:
+    def test_metadata_parsing(self, ble_packet_factory: BlePacketFactory) -> None:
         """Test metadata parsing from BLE data."""
         data = SpinTouchData()
 
-        ble_data = build_test_ble_data(
+        ble_data = ble_packet_factory(
             free_chlorine=2.5,
             ph=7.4,
             num_valid=5,
@@ -175,11 +280,11 @@ class TestSpinTouchData:
         assert data.sanitizer_type_index == 0
         assert data.sanitizer_type == "Chlorine"
 
-    def test_timestamp_parsing(self) -> None:
+    def test_timestamp_parsing(self, ble_packet_factory: BlePacketFactory) -> None:
         """Test timestamp parsing from BLE data."""
         data = SpinTouchData()
 
-        ble_data = build_test_ble_data(
+        ble_data = ble_packet_factory(
             free_chlorine=2.5,
             ph=7.4,
             year=25,  # 2025
@@ -197,12 +302,31 @@ class TestSpinTouchData:
         assert data.report_time.month == 11
         assert data.report_time.day == 29
 
-    def test_invalid_value_filtering(self) -> None:
+    def test_timestamp_parsing_12_hour(self, ble_packet_factory: BlePacketFactory) -> None:
+        """Test 12-hour timestamps are converted to 24-hour time."""
+        data = SpinTouchData()
+
+        ble_data = ble_packet_factory(
+            free_chlorine=2.5,
+            hour=2,
+            minute=15,
+            second=5,
+            ampm=1,  # PM
+            military=0,
+        )
+
+        data.update_from_bytes(ble_data)
+
+        assert data.report_time is not None
+        assert (data.report_time.hour, data.report_time.minute) == (14, 15)
+        assert data.report_time.second == 5
+
+    def test_invalid_value_filtering(self, ble_packet_factory: BlePacketFactory) -> None:
         """Test that invalid values are filtered out."""
         data = SpinTouchData()
 
         # Build data with invalid pH (out of range 0-14)
-        ble_data = build_test_ble_data(
+        ble_data = ble_packet_factory(
             free_chlorine=2.5,
             ph=99.0,  # Invalid
         )
@@ -212,6 +336,17 @@ class TestSpinTouchData:
         assert "free_chlorine" in data.values
         assert "ph" not in data.values  # Should be filtered
 
+    def test_nan_value_filtering(self, ble_packet_factory: BlePacketFactory) -> None:
+        """Test that NaN values are filtered out."""
+        data = SpinTouchData()
+
+        ble_data = ble_packet_factory(free_chlorine=float("nan"), ph=7.4)
+
+        data.update_from_bytes(ble_data)
+
+        assert "free_chlorine" not in data.values
+        assert "ph" in data.values
+
 
 def build_test_ble_data(
     free_chlorine: float | None = None,
@@ -238,9 +373,6 @@ def build_test_ble_data(
     sanitizer_idx: int = 0,
 ) -> bytes:
     """Build a test BLE data packet."""
-    # Start with signature
-    data = bytearray(START_SIGNATURE)
-
     # Map parameter names to (param_id, decimals, value)
     param_mapping: dict[str, tuple[int, int, float | None]] = {
         "free_chlorine": (0x01, 2, free_chlorine),
@@ -257,59 +389,288 @@ def build_test_ble_data(
     }
 
     # Build entries list from non-None values
-    entries: list[tuple[int, int, float]] = [
+    present: list[tuple[int, int, float]] = [
         (param_id, decimals, value)
         for param_id, decimals, value in param_mapping.values()
         if value is not None
     ]
 
-    # Pad to 12 entries
-    while len(entries) < 12:
-        entries.append((0x00, 0, 0.0))
-
-    for test_type, decimals, value in entries:
-        data.append(test_type)
-        data.append(decimals)
-        data.extend(struct.pack("<f", value))
+    # Pack present entries and pad to 12 with empty slots
+    entries = b"".join(
+        bytes((test_type, decimals)) + _F32.pack(value) for test_type, decimals, value in present
+    ) + _EMPTY_ENTRY * (12 - len(present))
+
+    return b"".join(
+        (
+            START_SIGNATURE,
+            entries,
+            # Timestamp (8 bytes)
+            bytes((year, month, day, hour, minute, second, ampm, military)),
+            # Metadata (3 bytes)
+            bytes((num_valid, disk_type_idx, sanitizer_idx)),
+            END_SIGNATURE,
+        )
+    )
 
-    # Timestamp (8 bytes)
-    data.extend([year, month, day, hour, minute, second, ampm, military])
 
-    # Metadata (3 bytes)
-    data.extend([num_valid, disk_type_idx, sanitizer_idx])
+class TestDataValidation:
+    """Test data validation functions."""
 
-    # End signature
-    data.extend(END_SIGNATURE)
+    @pytest.mark.parametrize(
+        ("args", "expected"),
+        [
+            ((2025, 11, 29, 12, 30, 45), True),
+            ((2020, 1, 1, 0, 0, 0), True),
+            ((2099, 12, 31, 23, 59, 59), True),
+            ((2019, 11, 29, 12, 30, 45), False),
+            ((2100, 11, 29, 12, 30, 45), False),
+            ((2025, 0, 29, 12, 30, 45), False),
+            ((2025, 13, 29, 12, 30, 45), False),
+            ((2025, 11, 0, 12, 30, 45), False),
+            ((2025, 11, 32, 12, 30, 45), False),
+            ((2025, 11, 29, 24, 30, 45), False),
+            ((2025, 11, 29, 12, 60, 45), False),
+            ((2025, 11, 29, 12, 30, 60), False),
+        ],
+    )
+    def test_is_valid_timestamp(self, args: tuple[int, ...], expected: bool) -> None:
+        """Test timestamp validation accepts valid dates and rejects out-of-range fields."""
+        assert SpinTouchData._is_valid_timestamp(*args) is expected
+
+
+class TestSpinTouchCoordinator:
+    """Test the SpinTouchCoordinator class."""
+
+    async def test_restore_last_states(self, hass: HomeAssistant) -> None:
+        """Test saved sensor states seed the data for the whole config entry."""
+        entry = MockConfigEntry(domain=DOMAIN, unique_id=TEST_ADDRESS)
+        entry.add_to_hass(hass)
+        registry = er.async_get(hass)
+        for key in (
+            "ph",
+            "salt",
+            "calcium",
+            "alkalinity",
+            "cyanuric_acid",
+            "free_chlorine",
+            "report_time",
+            "water_quality",
+        ):
+            registry.async_get_or_create(
+                "sensor",
+                DOMAIN,
+                f"{entry.entry_id}_{key}",
+                config_entry=entry,
+                suggested_object_id=key,
+            )
+        mock_restore_cache(
+            hass,
+            [
+                State("sensor.ph", "7.4"),
+                State("sensor.salt", "unavailable"),
+                State("sensor.calcium", "nan"),
+                State("sensor.alkalinity", "-inf"),
+                State("sensor.cyanuric_acid", "-nan"),
+                State("sensor.free_chlorine", "1e400"),
+                State("sensor.report_time", "2024-06-01T12:00:00+00:00"),
+                State("sensor.water_quality", "pH ↑"),
+            ],
+        )
 
-    return bytes(data)
+        coordinator = SpinTouchCoordinator(hass, TEST_ADDRESS)
+        coordinator.async_restore_last_states(entry.entry_id)
 
+        data = coordinator._data
+        assert data.values == {"ph": 7.4}
+        assert data.report_time == datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
+        assert data.last_reading_time is None
 
-class TestDataValidation:
-    """Test data validation functions."""
+    async def test_readings_without_valid_clock_notify_listeners(
+        self, coordinator: SpinTouchCoordinator, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test every accepted reading notifies listeners when the report time is invalid."""
+        reading_times: list[datetime | None] = []
+        coordinator.async_add_listener(
+            lambda: reading_times.append(coordinator.data.last_reading_time)
+        )
+        # Month 13 is rejected, so report_time stays None and every packet is new
+        packet = ble_packet_factory(free_chlorine=2.5, ph=7.4, month=13)
+
+        for _ in range(3):
+            assert coordinator._process_reading(packet) is True
+
+        assert coordinator.data.report_time is None
+        assert len(reading_times) == 3
+        assert reading_times[-1] is not None
+
+    async def test_value_listener_only_fires_on_change(
+        self, coordinator: SpinTouchCoordinator, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test a listener keyed by value only runs when that value changes."""
+        ph_updates = Mock()
+        general_updates = Mock()
+        coordinator.async_add_listener(ph_updates, "ph")
+        coordinator.async_add_listener(general_updates)
+
+        coordinator._process_reading(ble_packet_factory(free_chlorine=2.5, ph=7.4, second=1))
+        assert ph_updates.call_count == 1
+
+        coordinator._process_reading(ble_packet_factory(free_chlorine=3.0, ph=7.4, second=2))
+        assert ph_updates.call_count == 1
+
+        coordinator._process_reading(ble_packet_factory(free_chlorine=3.0, ph=7.6, second=3))
+        assert ph_updates.call_count == 2
+        assert general_updates.call_count == 3
+
+    async def test_value_listener_unsubscribe(self, coordinator: SpinTouchCoordinator) -> None:
+        """Test removing value listeners drops the key once none are left."""
+        remove_first = coordinator.async_add_listener(Mock(), "ph")
+        remove_second = coordinator.async_add_listener(Mock(), "ph")
+
+        remove_first()
+        assert len(coordinator._value_listeners["ph"]) == 1
+
+        remove_second()
+        assert "ph" not in coordinator._value_listeners
+        assert not coordinator._listeners
+
+    async def test_value_listener_after_restore(
+        self, hass: HomeAssistant, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test the first reading only fires value listeners that differ from restored state."""
+        entry = MockConfigEntry(domain=DOMAIN, unique_id=TEST_ADDRESS)
+        entry.add_to_hass(hass)
+        registry = er.async_get(hass)
+        for key in ("ph", "free_chlorine"):
+            registry.async_get_or_create(
+                "sensor",
+                DOMAIN,
+                f"{entry.entry_id}_{key}",
+                config_entry=entry,
+                suggested_object_id=key,
+            )
+        mock_restore_cache(hass, [State("sensor.ph", "7.4"), State("sensor.free_chlorine", "2.0")])
+
+        coordinator = SpinTouchCoordinator(hass, TEST_ADDRESS)
+        coordinator.async_restore_last_states(entry.entry_id)
+        ph_updates = Mock()
+        chlorine_updates = Mock()
+        coordinator.async_add_listener(ph_updates, "ph")
+        coordinator.async_add_listener(chlorine_updates, "free_chlorine")
+
+        coordinator._process_reading(ble_packet_factory(free_chlorine=2.5, ph=7.4))
+        coordinator._timers.cancel_all()
+
+        ph_updates.assert_not_called()
+        chlorine_updates.assert_called_once()
+
+    async def test_status_notification_burst_coalesced(
+        self,
+        hass: HomeAssistant,
+        coordinator: SpinTouchCoordinator,
+        ble_packet_factory: BlePacketFactory,
+    ) -> None:
+        """Test triggers arriving during a read cause exactly one follow-up read."""
+        read_released = asyncio.Event()
+        packet = ble_packet_factory(free_chlorine=2.5, ph=7.4)
+
+        async def _read_gatt_char(_uuid: str) -> bytearray:
+            await read_released.wait()
+            return bytearray(packet)
+
+        client = Mock(is_connected=True, write_gatt_char=AsyncMock())
+        client.read_gatt_char = AsyncMock(side_effect=_read_gatt_char)
+        coordinator._client = client
+
+        for _ in range(4):
+            coordinator._on_status_notification(None, bytearray(b"\x01"))
+        assert client.read_gatt_char.call_count == 1
+
+        read_released.set()
+        await hass.async_block_till_done()
+
+        assert client.read_gatt_char.call_count == 2
+        assert coordinator._read_task is not None
+        assert coordinator._read_task.done()
+        assert coordinator.data.values["ph"] == 7.4
+
+    async def test_full_size_status_notification_parsed_inline(
+        self,
+        hass: HomeAssistant,
+        coordinator: SpinTouchCoordinator,
+        ble_packet_factory: BlePacketFactory,
+    ) -> None:
+        """Test a notification carrying a whole report is parsed without a GATT read."""
+        client = Mock(is_connected=True, read_gatt_char=AsyncMock(), write_gatt_char=AsyncMock())
+        coordinator._client = client
+
+        coordinator._on_status_notification(
+            None, bytearray(ble_packet_factory(free_chlorine=2.5, ph=7.4))
+        )
+        await hass.async_block_till_done()
+
+        client.read_gatt_char.assert_not_called()
+        client.write_gatt_char.assert_called_once()
+        assert coordinator._read_task is None
+        assert coordinator.data.values["ph"] == 7.4
+
+    async def test_disconnect_deadline_extended_by_readings(
+        self, coordinator: SpinTouchCoordinator, ble_packet_factory: BlePacketFactory
+    ) -> None:
+        """Test later readings move the deadline without creating a new timer handle."""
+        coordinator._process_reading(ble_packet_factory(free_chlorine=2.5, second=1))
+        handle = coordinator._timers._timers[TIMER_DISCONNECT]
+        first_deadline = coordinator._disconnect_deadline
+
+        coordinator._process_reading(ble_packet_factory(free_chlorine=2.5, second=2))
+
+        assert coordinator._timers._timers[TIMER_DISCONNECT] is handle
+        assert coordinator._disconnect_deadline >= first_deadline
+
+    async def test_disconnect_deadline_rearms_when_early(
+        self,
+        hass: HomeAssistant,
+        coordinator: SpinTouchCoordinator,
+        ble_packet_factory: BlePacketFactory,
+    ) -> None:
+        """Test the disconnect timer re-arms until the deadline has really passed."""
+        coordinator._process_reading(ble_packet_factory(free_chlorine=2.5))
+        handle = coordinator._timers._timers[TIMER_DISCONNECT]
+
+        # Fired handles run without loop.time() advancing, like an early wakeup
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=DISCONNECT_DELAY + 1))
+
+        rearmed = coordinator._timers._timers[TIMER_DISCONNECT]
+        assert rearmed is not handle
+        assert rearmed.when() == coordinator._disconnect_deadline
+        assert coordinator.data.connection_enabled
+
+        coordinator._disconnect_deadline = hass.loop.time()
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=DISCONNECT_DELAY + 1))
+        await hass.async_block_till_done()
+
+        assert not coordinator._timers.is_active(TIMER_DISCONNECT)
+        assert not coordinator.data.connection_enabled
+        assert coordinator._stay_disconnected
+
+    async def test_reads_skipped_during_reconnect_delay(
+        self,
+        hass: HomeAssistant,
+        coordinator: SpinTouchCoordinator,
+        ble_packet_factory: BlePacketFactory,
+    ) -> None:
+        """Test nothing is read or parsed while the phone app has the device."""
+        client = Mock(is_connected=True, read_gatt_char=AsyncMock(), write_gatt_char=AsyncMock())
+        coordinator._client = client
+        coordinator._stay_disconnected = True
+
+        await coordinator._async_read_data()
+        coordinator._on_status_notification(
+            None, bytearray(ble_packet_factory(free_chlorine=2.5, ph=7.4))
+        )
+        coordinator._on_status_notification(None, bytearray(b"\x01"))
+        await hass.async_block_till_done()
 
-    def test_valid_timestamp_range(self) -> None:
-        """Test timestamp validation accepts valid dates."""
-        assert SpinTouchData._is_valid_timestamp(2025, 11, 29, 12, 30, 45)
-        assert SpinTouchData._is_valid_timestamp(2020, 1, 1, 0, 0, 0)
-        assert SpinTouchData._is_valid_timestamp(2099, 12, 31, 23, 59, 59)
-
-    def test_invalid_timestamp_year(self) -> None:
-        """Test timestamp validation rejects invalid year."""
-        assert not SpinTouchData._is_valid_timestamp(2019, 11, 29, 12, 30, 45)
-        assert not SpinTouchData._is_valid_timestamp(2100, 11, 29, 12, 30, 45)
-
-    def test_invalid_timestamp_month(self) -> None:
-        """Test timestamp validation rejects invalid month."""
-        assert not SpinTouchData._is_valid_timestamp(2025, 0, 29, 12, 30, 45)
-        assert not SpinTouchData._is_valid_timestamp(2025, 13, 29, 12, 30, 45)
-
-    def test_invalid_timestamp_day(self) -> None:
-        """Test timestamp validation rejects invalid day."""
-        assert not SpinTouchData._is_valid_timestamp(2025, 11, 0, 12, 30, 45)
-        assert not SpinTouchData._is_valid_timestamp(2025, 11, 32, 12, 30, 45)
-
-    def test_invalid_timestamp_time(self) -> None:
-        """Test timestamp validation rejects invalid time."""
-        assert not SpinTouchData._is_valid_timestamp(2025, 11, 29, 24, 30, 45)
-        assert not SpinTouchData._is_valid_timestamp(2025, 11, 29, 12, 60, 45)
-        assert not SpinTouchData._is_valid_timestamp(2025, 11, 29, 12, 30, 60)
+        client.read_gatt_char.assert_not_called()
+        client.write_gatt_char.assert_not_called()
+        assert not coordinator._data.values
@@ -0,0 +1,87 @@
+"""Tests for SpinTouch utilities."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.spintouch.util import TimerManager
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+class TestTimerManager:
+    """Test the TimerManager class."""
+
+    async def test_schedule_fires_once(self, hass: HomeAssistant) -> None:
+        """Test a scheduled callback runs once and its bookkeeping is dropped."""
+        timers = TimerManager(hass)
+        callback_fn = Mock()
+
+        timers.schedule("test", 10, callback_fn)
+        assert timers.is_active("test")
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+
+        callback_fn.assert_called_once()
+        assert not timers.is_active("test")
+        assert not timers._callbacks
+
+    async def test_schedule_replaces_existing(self, hass: HomeAssistant) -> None:
+        """Test scheduling a name again cancels the earlier timer."""
+        timers = TimerManager(hass)
+        first = Mock()
+        second = Mock()
+
+        timers.schedule("test", 10, first)
+        timers.schedule("test", 20, second)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=21))
+
+        first.assert_not_called()
+        second.assert_called_once()
+
+    async def test_schedule_at(self, hass: HomeAssistant) -> None:
+        """Test a callback scheduled at a loop time fires once that time has passed."""
+        timers = TimerManager(hass)
+        callback_fn = Mock()
+
+        timers.schedule_at("test", hass.loop.time() + 10, callback_fn)
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+        callback_fn.assert_not_called()
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        callback_fn.assert_called_once()
+        assert not timers.is_active("test")
+
+    async def test_cancel(self, hass: HomeAssistant) -> None:
+        """Test a canceled timer never fires and forgets its callback."""
+        timers = TimerManager(hass)
+        callback_fn = Mock()
+
+        timers.schedule("test", 10, callback_fn)
+        assert timers.cancel("test") is True
+        assert timers.cancel("test") is False
+        assert not timers._callbacks
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        callback_fn.assert_not_called()
+
+    async def test_cancel_all(self, hass: HomeAssistant) -> None:
+        """Test canceling all timers at once."""
+        timers = TimerManager(hass)
+        callbacks = [Mock(), Mock()]
+
+        timers.schedule("first", 10, callbacks[0])
+        timers.schedule_at("second", hass.loop.time() + 10, callbacks[1])
+        timers.cancel_all()
+
+        assert not timers._timers
+        assert not timers._callbacks
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+        for callback_fn in callbacks:
+            callback_fn.assert_not_called()